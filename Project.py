@@ -3,12 +3,16 @@ from tkinter import ttk, messagebox, filedialog
 import heapq
 import math
 import random
-from enum import Enum
+from enum import Enum, IntEnum
 import time
 import json
+import base64
+import threading
 from collections import deque
+from array import array
+from functools import lru_cache
 
-class CellType(Enum):
+class CellType(IntEnum):
     EMPTY = 0
     OBSTACLE = 1
     START = 2
@@ -19,12 +23,350 @@ class CellType(Enum):
     FRONTIER = 7
     CURRENT = 8
 
+CELL_COLORS = {
+    CellType.EMPTY: "white",
+    CellType.OBSTACLE: "black",
+    CellType.START: "green",
+    CellType.GOAL: "red",
+    CellType.PATH: "blue",
+    CellType.VISITED: "lightgray",
+    CellType.ROBOT: "orange",
+    CellType.FRONTIER: "lightblue",
+    CellType.CURRENT: "yellow"
+}
+
+# Cell types drawn by a search or path animation; clear_path resets exactly these
+_TRANSIENT_CELLS = frozenset({CellType.PATH, CellType.VISITED, CellType.FRONTIER, CellType.CURRENT})
+
+# Cells a transient type must not paint over, see set_cells
+_ENDPOINT_CELLS = frozenset({CellType.START, CellType.GOAL})
+
+# bytes.translate tables: obstacle mask, and transient cells back to EMPTY
+_OBSTACLE_TABLE = bytes(cell == CellType.OBSTACLE for cell in range(256))
+_UNDECORATE_TABLE = bytes(CellType.EMPTY if cell in _TRANSIENT_CELLS else cell for cell in range(256))
+
+# Layout files: version 2 stores the grid as base64 in "grid_b64"
+LAYOUT_VERSION = 2
+
+# Playback and robot motion share one frame tick, stepped by wall-clock time
+DEFAULT_TARGET_FPS = 60
+MIN_TARGET_FPS = 10
+MAX_TARGET_FPS = 120
+
+# Finished searches kept by run_search, keyed by endpoints, algorithm and obstacle hash
+PATH_CACHE_SIZE = 16
+
+# Searches run on a worker thread; the Tk thread checks for the result this often
+SEARCH_POLL_MS = 10
+
 class Algorithm(Enum):
     ASTAR = "A*"
     BFS = "BFS"
     DFS = "DFS"
     UCS = "UCS"
     DLS = "DLS"
+    IDDFS = "IDDFS"
+    BIDIRECTIONAL_BFS = "Bidirectional BFS"
+
+# === Search cores ===
+# Tk-free searches over packed cell indices; each returns (goal or None, parents, visited_order, frontier, nodes_explored)
+
+@lru_cache(maxsize=4)
+def _neighbor_table(rows, cols):
+    # In-bounds neighbors of every cell, up, right, down, left, cached per grid size
+    table = []
+    for row in range(rows):
+        up = row > 0
+        down = row < rows - 1
+        row_start = row * cols
+        for idx in range(row_start, row_start + cols):
+            col = idx - row_start
+            if up and down and 0 < col < cols - 1:
+                table.append((idx - cols, idx + 1, idx + cols, idx - 1))
+                continue
+            neighbors = []
+            if up:
+                neighbors.append(idx - cols)
+            if col < cols - 1:
+                neighbors.append(idx + 1)
+            if down:
+                neighbors.append(idx + cols)
+            if col > 0:
+                neighbors.append(idx - 1)
+            table.append(tuple(neighbors))
+    return tuple(table)
+
+def _open_neighbors(blocked, neighbors, idx):
+    # Neighbors of one cell that are not obstacles, in the order of the full table
+    return tuple([neighbor for neighbor in neighbors[idx] if not blocked[neighbor]])
+
+def _open_neighbor_table(blocked, neighbors):
+    # Walkable neighbors of every cell for an obstacle mask
+    return [_open_neighbors(blocked, neighbors, idx) for idx in range(len(neighbors))]
+
+@lru_cache(maxsize=8)
+def _manhattan_table(rows, cols, goal):
+    # Manhattan distance to the goal for every cell, cached per goal
+    goal_row, goal_col = divmod(goal, cols)
+    col_dist = [abs(col - goal_col) for col in range(cols)]
+    return tuple([row_dist + d for row_dist in [abs(row - goal_row) for row in range(rows)] for d in col_dist])
+
+@lru_cache(maxsize=8)
+def _zobrist_keys(cells):
+    # One random 64-bit word per cell, from a seeded private generator
+    rng = random.Random(cells)
+    return tuple([rng.getrandbits(64) for _ in range(cells)])
+
+def _obstacle_hash(blocked):
+    # Full obstacle hash for a mask, used when a whole grid is replaced
+    keys = _zobrist_keys(len(blocked))
+    value = 0
+    for idx, cell in enumerate(blocked):
+        if cell:
+            value ^= keys[idx]
+    return value
+
+def _heap_frontier(open_set, g_score):
+    # Cells still waiting in the heap; entries whose g is no longer the cell's g_score are stale
+    return [idx for _, g, idx in open_set if g == g_score[idx]]
+
+def _stack_frontier(stack, seen):
+    # Stack cells not expanded yet, each once; seen is reused as the filter
+    frontier = []
+    for idx in stack:
+        if not seen[idx]:
+            seen[idx] = 1
+            frontier.append(idx)
+    return frontier
+
+def _best_first_core(neighbors, rows, cols, start, goal, use_heuristic):
+    # A* when use_heuristic is set, UCS (a zero heuristic) otherwise
+    # Heap entries are (f, g, idx); stale once g_score[idx] drops below g
+    h_score = _manhattan_table(rows, cols, goal) if use_heuristic else [0] * (rows * cols)
+    open_set = [(h_score[start], 0, start)]
+    parents = array('i', [-1]) * (rows * cols)  # -1 = no parent
+    g_score = [math.inf] * (rows * cols)
+    g_score[start] = 0
+    visited = []
+    nodes_explored = 1
+    
+    # UCS stops when the goal is pushed; A* waits until it is popped
+    early_goal = -1 if use_heuristic else goal
+    goal_g = math.inf  # g_score[goal], kept in a local for the prune below
+    
+    while open_set:
+        # Get node with lowest f_score
+        _, current_g, current = heapq.heappop(open_set)
+        
+        # Skip stale heap entries left behind by a later, cheaper push
+        if current_g > g_score[current]:
+            continue
+        
+        visited.append(current)
+        
+        if current == goal:
+            return current, parents, visited, _heap_frontier(open_set, g_score), nodes_explored
+        
+        tentative_g_score = current_g + 1
+        
+        # Lazy deletion; pushes whose f cannot beat the goal's g are dropped
+        for neighbor in neighbors[current]:
+            if tentative_g_score >= g_score[neighbor]:
+                continue
+            f_score = tentative_g_score + h_score[neighbor]
+            if f_score < goal_g:
+                parents[neighbor] = current
+                if neighbor == goal:
+                    if neighbor == early_goal:
+                        return neighbor, parents, visited, _heap_frontier(open_set, g_score), nodes_explored + 1
+                    goal_g = tentative_g_score
+                g_score[neighbor] = tentative_g_score
+                heapq.heappush(open_set, (f_score, tentative_g_score, neighbor))
+                nodes_explored += 1
+    
+    return None, parents, visited, [], nodes_explored
+
+def _bfs_core(neighbors, rows, cols, start, goal):
+    # The queue list is walked while it grows; it is never popped
+    queue = [start]
+    seen = bytearray(rows * cols)
+    seen[start] = 1
+    parents = array('i', [-1]) * (rows * cols)  # -1 = no parent
+    
+    if start == goal:
+        return start, parents, queue, [], 1
+    
+    # Unit steps, so the goal is tested when generated
+    for head, current in enumerate(queue):
+        for neighbor in neighbors[current]:
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                parents[neighbor] = current
+                if neighbor == goal:
+                    return neighbor, parents, queue[:head + 1], queue[head + 1:], len(queue) + 1
+                queue.append(neighbor)
+    
+    return None, parents, queue, [], len(queue)
+
+def _depth_first_core(neighbors, rows, cols, start, goal, depth_limit=math.inf):
+    # DFS by default, DLS when a depth limit is given
+    # Cells and their depths on two parallel stacks rather than one stack of tuples
+    stack = [start]
+    depths = [0]
+    seen = bytearray(rows * cols)
+    parents = array('i', [-1]) * (rows * cols)  # -1 = no parent
+    visited = []
+    nodes_explored = 1
+    
+    while stack:
+        current = stack.pop()
+        depth = depths.pop()
+        
+        if seen[current]:
+            continue
+        
+        seen[current] = 1
+        visited.append(current)
+        
+        if current == goal:
+            return current, parents, visited, _stack_frontier(stack, seen), nodes_explored
+        
+        if depth >= depth_limit:
+            continue
+        
+        # Pushed in reverse so neighbors are expanded up, right, down, left
+        for neighbor in reversed(neighbors[current]):
+            if not seen[neighbor]:
+                parents[neighbor] = current
+                stack.append(neighbor)
+                depths.append(depth + 1)
+                nodes_explored += 1
+    
+    return None, parents, visited, [], nodes_explored
+
+def _iddfs_core(neighbors, rows, cols, start, goal):
+    # Iterative deepening with a Manhattan cutoff; stats cover the final pass only
+    
+    # Rule out an unreachable goal with one plain DFS sweep
+    reachable = _depth_first_core(neighbors, rows, cols, start, goal)
+    if reachable[0] is None:
+        return reachable
+    
+    h_score = _manhattan_table(rows, cols, goal)
+    parents = array('i', [-1]) * (rows * cols)  # -1 = no parent
+    unreached = rows * cols
+    
+    # Start at the Manhattan distance and keep its parity
+    depth_limit = h_score[start]
+    
+    while True:
+        stack = [start]
+        depths = [0]  # parallel to stack, as in _depth_first_core
+        best_depth = array('i', [unreached]) * (rows * cols)  # shallowest depth reached this pass
+        best_depth[start] = 0
+        expanded = bytearray(rows * cols)
+        visited = []
+        nodes_explored = 1
+        
+        while stack:
+            current = stack.pop()
+            depth = depths.pop()
+            
+            # Skip entries superseded by a shallower push of the same cell
+            if depth > best_depth[current]:
+                continue
+            
+            # Re-expanded cells are recorded only the first time
+            if not expanded[current]:
+                expanded[current] = 1
+                visited.append(current)
+            
+            if current == goal:
+                frontier = [idx for idx, d in zip(stack, depths) if d == best_depth[idx] and not expanded[idx]]
+                return current, parents, visited, frontier, nodes_explored
+            
+            next_depth = depth + 1
+            budget = depth_limit - next_depth
+            
+            # Pushed in reverse so neighbors are expanded up, right, down, left
+            for neighbor in reversed(neighbors[current]):
+                if next_depth < best_depth[neighbor] and h_score[neighbor] <= budget:
+                    if best_depth[neighbor] == unreached:
+                        nodes_explored += 1
+                    best_depth[neighbor] = next_depth
+                    parents[neighbor] = current
+                    stack.append(neighbor)
+                    depths.append(next_depth)
+        
+        depth_limit += 2
+
+def _bidirectional_bfs_core(neighbors, rows, cols, start, goal):
+    # BFS from both ends, one whole layer of the smaller side per round
+    parents = array('i', [-1]) * (rows * cols), array('i', [-1]) * (rows * cols)  # forward, backward
+    dist = array('i', [-1]) * (rows * cols), array('i', [-1]) * (rows * cols)  # -1 = not reached from that side
+    dist[0][start] = 0
+    dist[1][goal] = 0
+    layers = [[start], [goal]]
+    visited = []
+    nodes_explored = 1
+    
+    if start == goal:
+        return start, parents[0], [start], [], nodes_explored
+    
+    nodes_explored += 1
+    
+    while layers[0] and layers[1]:
+        side = 0 if len(layers[0]) <= len(layers[1]) else 1
+        own_parents, own_dist, other_dist = parents[side], dist[side], dist[1 - side]
+        next_layer = []
+        meet = -1
+        meet_length = 0
+        
+        for current in layers[side]:
+            visited.append(current)
+            next_dist = own_dist[current] + 1
+            
+            for neighbor in neighbors[current]:
+                if own_dist[neighbor] < 0:
+                    own_dist[neighbor] = next_dist
+                    own_parents[neighbor] = current
+                    next_layer.append(neighbor)
+                    nodes_explored += 1
+                    if other_dist[neighbor] >= 0 and (meet < 0 or next_dist + other_dist[neighbor] < meet_length):
+                        meet = neighbor
+                        meet_length = next_dist + other_dist[neighbor]
+        
+        layers[side] = next_layer
+        
+        if meet >= 0:
+            # Re-point the backward half so the goal leads back through meet to the start
+            forward, backward = parents
+            current = meet
+            while current != goal:
+                forward[backward[current]] = current
+                current = backward[current]
+            frontier = layers[0] + [idx for idx in layers[1] if dist[0][idx] < 0]
+            return goal, forward, visited, frontier, nodes_explored
+    
+    return None, parents[0], visited, [], nodes_explored
+
+def _run_core(algorithm, neighbors, rows, cols, start, goal, depth_limit):
+    # Dispatch on the Algorithm value; safe to call off the Tk thread
+    if algorithm == Algorithm.ASTAR.value:
+        return _best_first_core(neighbors, rows, cols, start, goal, use_heuristic=True)
+    elif algorithm == Algorithm.BFS.value:
+        return _bfs_core(neighbors, rows, cols, start, goal)
+    elif algorithm == Algorithm.DFS.value:
+        return _depth_first_core(neighbors, rows, cols, start, goal)
+    elif algorithm == Algorithm.UCS.value:
+        return _best_first_core(neighbors, rows, cols, start, goal, use_heuristic=False)
+    elif algorithm == Algorithm.BIDIRECTIONAL_BFS.value:
+        return _bidirectional_bfs_core(neighbors, rows, cols, start, goal)
+    elif algorithm == Algorithm.IDDFS.value:
+        return _iddfs_core(neighbors, rows, cols, start, goal)
+    elif algorithm == Algorithm.DLS.value:
+        return _depth_first_core(neighbors, rows, cols, start, goal, depth_limit)
+    raise ValueError(f"unknown algorithm: {algorithm}")
 
 class WarehouseRobotPicker:
     def __init__(self, root):
@@ -36,29 +378,45 @@ class WarehouseRobotPicker:
         self.rows = 25
         self.cols = 35
         self.cell_size = 20
-        self.grid = [[CellType.EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = bytearray(self.rows * self.cols)  # CellType per cell, row-major, see cell_index
+        self.obstacle_mask = bytearray(self.rows * self.cols)  # 1 where grid holds OBSTACLE, kept by set_cell
+        self.neighbor_table = _neighbor_table(self.rows, self.cols)  # shared by every grid of this size, see _neighbor_table
+        self.open_neighbors = list(self.neighbor_table)  # walkable neighbors per cell, kept by set_cell
+        self.obstacle_hash = 0  # xor of _zobrist_keys over obstacle cells, kept by set_cell
+        self.path_cache = {}  # (start, goal, algorithm, depth limit, obstacle_hash) -> (result, ns)
+        self.rect_ids = []  # canvas rectangle per cell index, see create_cell_items
+        self.robot_item = None  # canvas oval for the robot, moved by draw_robot
+        self.robot_drawn_pos = None  # cell robot_item currently sits on
+        self.dirty_cells = set()  # cell indices to recolor on the next draw_grid
+        self.transient_cells = set()  # cell indices set to a _TRANSIENT_CELLS type since the last clear
+        self._redraw_pending = False  # an after_idle draw_grid is queued, see schedule_redraw
         
         # Robot parameters
         self.robot_pos = None
         self.start_pos = None
         self.goal_pos = None
         self.path = []
-        self.visited_cells = set()
-        self.frontier_cells = set()
+        self.visited_cells = []
+        self.frontier_cells = []
         self.current_cell = None
         
         # Animation parameters
         self.animation_speed = 50  # ms between animation steps
         self.is_running = False
         self.show_search_process = True
+        self.frame_task = None  # step run by frame_tick until it returns False
+        self.display_scheduled = False  # a frame_tick is pending, see schedule_frame
+        self.target_fps = DEFAULT_TARGET_FPS  # last valid frame rate read from target_fps_var
+        self.total_start_ns = 0  # perf_counter_ns when run_search started, for total_time_ns
+        self.search_thread = None  # worker running the current search, see run_search
         
         # Statistics
         self.stats = {
             "path_length": 0,
             "nodes_visited": 0,
             "nodes_explored": 0,
-            "algorithm_time": 0,  # Pure algorithm execution time
-            "total_time": 0,      # Total time including visualization
+            "algorithm_time_ns": 0,  # Pure algorithm execution time
+            "total_time_ns": 0,      # Total time including visualization
             "algorithm": ""
         }
         
@@ -127,6 +485,13 @@ class WarehouseRobotPicker:
                                orient=tk.HORIZONTAL, length=250)
         speed_scale.pack(fill=tk.X, pady=5)
         
+        fps_frame = ttk.Frame(anim_frame)
+        fps_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(fps_frame, text="Frame Rate (FPS):").pack(side=tk.LEFT)
+        self.target_fps_var = tk.IntVar(value=DEFAULT_TARGET_FPS)
+        ttk.Spinbox(fps_frame, from_=MIN_TARGET_FPS, to=MAX_TARGET_FPS, textvariable=self.target_fps_var,
+                    width=5).pack(side=tk.LEFT, padx=(5, 0))
+        
         # File operations
         file_frame = ttk.LabelFrame(left_panel, text="File Operations", padding=10)
         file_frame.pack(fill=tk.X, pady=(0, 10))
@@ -138,8 +503,13 @@ class WarehouseRobotPicker:
         stats_frame = ttk.LabelFrame(left_panel, text="Statistics", padding=10)
         stats_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.stats_text = tk.Text(stats_frame, height=10, width=30, wrap=tk.WORD)
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        # One label per stat, so update_stats only sets the lines whose text changed
+        self.stat_vars = {}
+        self.stat_texts = {}  # text last set on each of stat_vars
+        for key in ("algorithm", "path_length", "nodes_visited", "nodes_explored", "algorithm_time",
+                    "total_time", "depth_limit", "optimal"):
+            self.stat_vars[key] = tk.StringVar()
+            ttk.Label(stats_frame, textvariable=self.stat_vars[key], anchor=tk.W).pack(fill=tk.X)
         
         # === Right Panel ===
         
@@ -199,16 +569,25 @@ class WarehouseRobotPicker:
             self.dls_frame.pack_forget()
     
     def reset_grid(self):
-        self.grid = [[CellType.EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = bytearray(self.rows * self.cols)
+        self.obstacle_mask = bytearray(self.rows * self.cols)
+        self.neighbor_table = _neighbor_table(self.rows, self.cols)
+        self.open_neighbors = list(self.neighbor_table)
+        self.obstacle_hash = 0
+        self.path_cache = {}
+        self.transient_cells = set()
         self.start_pos = None
         self.goal_pos = None
         self.robot_pos = None
         self.path = []
-        self.visited_cells = set()
-        self.frontier_cells = set()
+        self.visited_cells = []
+        self.frontier_cells = []
         self.current_cell = None
         self.is_running = False
+        self.frame_task = None
+        self.search_thread = None  # a search still running reports to nobody
         
+        self.create_cell_items()
         self.draw_grid()
         self.update_stats()
         self.status_var.set("Grid reset. Click to set start position, then goal position")
@@ -216,29 +595,37 @@ class WarehouseRobotPicker:
     def add_random_obstacles(self, density=0.2):
         self.clear_path()
         
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.grid[i][j] == CellType.EMPTY and random.random() < density:
-                    self.grid[i][j] = CellType.OBSTACLE
+        # Jump geometric gaps between obstacles instead of drawing per cell
+        total_cells = self.rows * self.cols
+        log_miss = math.log(1.0 - density) if 0 < density < 1 else None
+        idx = -1
+        
+        while density > 0:
+            idx += 1 if log_miss is None else 1 + int(math.log(1.0 - random.random()) / log_miss)
+            if idx >= total_cells:
+                break
+            
+            if self.grid[idx] == CellType.EMPTY:
+                self.set_cell(*divmod(idx, self.cols), CellType.OBSTACLE)
         
         self.draw_grid()
         self.status_var.set(f"Added random obstacles ({int(density*100)}% density)")
     
     def clear_path(self):
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.grid[i][j] in [CellType.PATH, CellType.VISITED, CellType.FRONTIER, CellType.CURRENT]:
-                    self.grid[i][j] = CellType.EMPTY
+        # Only cells painted by the last search can hold a transient type
+        grid = self.grid
+        self.set_cells([idx for idx in self.transient_cells if grid[idx] in _TRANSIENT_CELLS], CellType.EMPTY)
+        self.transient_cells = set()
         
         # Restore start and goal
         if self.start_pos:
-            self.grid[self.start_pos[0]][self.start_pos[1]] = CellType.START
+            self.set_cell(self.start_pos[0], self.start_pos[1], CellType.START)
         if self.goal_pos:
-            self.grid[self.goal_pos[0]][self.goal_pos[1]] = CellType.GOAL
+            self.set_cell(self.goal_pos[0], self.goal_pos[1], CellType.GOAL)
         
         self.path = []
-        self.visited_cells = set()
-        self.frontier_cells = set()
+        self.visited_cells = []
+        self.frontier_cells = []
         self.current_cell = None
         self.robot_pos = None
         self.draw_grid()
@@ -249,25 +636,18 @@ class WarehouseRobotPicker:
         self.clear_path()
         
         # Find empty cells
-        empty_cells = [(i, j) for i in range(self.rows) for j in range(self.cols) 
-                      if self.grid[i][j] == CellType.EMPTY]
+        empty_cells = [divmod(idx, self.cols) for idx, cell in enumerate(self.grid) if cell == CellType.EMPTY]
         
         if len(empty_cells) < 2:
             messagebox.showwarning("Not Enough Space", "Need at least 2 empty cells for start and goal")
             return
         
-        # Randomly select start and goal
-        start_idx = random.randint(0, len(empty_cells) - 1)
-        self.start_pos = empty_cells[start_idx]
-        
-        goal_idx = random.randint(0, len(empty_cells) - 1)
-        while goal_idx == start_idx:
-            goal_idx = random.randint(0, len(empty_cells) - 1)
-        self.goal_pos = empty_cells[goal_idx]
+        # Randomly select two distinct cells for start and goal in one draw
+        self.start_pos, self.goal_pos = random.sample(empty_cells, 2)
         
         # Update grid
-        self.grid[self.start_pos[0]][self.start_pos[1]] = CellType.START
-        self.grid[self.goal_pos[0]][self.goal_pos[1]] = CellType.GOAL
+        self.set_cell(self.start_pos[0], self.start_pos[1], CellType.START)
+        self.set_cell(self.goal_pos[0], self.goal_pos[1], CellType.GOAL)
         
         self.draw_grid()
         self.status_var.set("Random start and goal positions set")
@@ -281,18 +661,11 @@ class WarehouseRobotPicker:
         if not file_path:
             return
         
-        # Convert grid to serializable format
-        grid_data = []
-        for i in range(self.rows):
-            row = []
-            for j in range(self.cols):
-                row.append(self.grid[i][j].value)
-            grid_data.append(row)
-        
         layout = {
+            "version": LAYOUT_VERSION,
             "rows": self.rows,
             "cols": self.cols,
-            "grid": grid_data,
+            "grid_b64": base64.b64encode(self.grid).decode("ascii"),
             "start_pos": self.start_pos,
             "goal_pos": self.goal_pos
         }
@@ -314,30 +687,59 @@ class WarehouseRobotPicker:
             with open(file_path, 'r') as f:
                 layout = json.load(f)
             
-            self.rows = layout["rows"]
-            self.cols = layout["cols"]
+            # Parse and check into locals, so a rejected file changes nothing
+            rows = layout["rows"]
+            cols = layout["cols"]
+            
+            # Load grid, dropping any search decorations saved with it
+            if layout.get("version", 1) >= 2:
+                grid = bytearray(base64.b64decode(layout["grid_b64"]))
+                for cell in set(grid):
+                    CellType(cell)  # rejects unknown values, like the nested-list path
+            else:
+                grid = bytearray(CellType(cell) for row in layout["grid"] for cell in row)
+            if len(grid) != rows * cols:
+                raise ValueError("grid size does not match rows and cols")
+            grid = grid.translate(_UNDECORATE_TABLE)
+            obstacle_mask = grid.translate(_OBSTACLE_TABLE)
+            neighbor_table = _neighbor_table(rows, cols)
             
-            # Load grid
-            self.grid = []
-            for i in range(self.rows):
-                row = []
-                for j in range(self.cols):
-                    row.append(CellType(layout["grid"][i][j]))
-                self.grid.append(row)
+            start_pos = tuple(layout["start_pos"]) if layout["start_pos"] else None
+            goal_pos = tuple(layout["goal_pos"]) if layout["goal_pos"] else None
+            for name, pos in (("start", start_pos), ("goal", goal_pos)):
+                if pos is None:
+                    continue
+                if len(pos) != 2 or not (0 <= pos[0] < rows and 0 <= pos[1] < cols):
+                    raise ValueError(f"{name} position {list(pos)} is outside the grid")
+                if grid[pos[0] * cols + pos[1]] == CellType.OBSTACLE:
+                    raise ValueError(f"{name} position {list(pos)} is an obstacle")
             
-            self.start_pos = tuple(layout["start_pos"]) if layout["start_pos"] else None
-            self.goal_pos = tuple(layout["goal_pos"]) if layout["goal_pos"] else None
+            self.rows = rows
+            self.cols = cols
+            self.grid = grid
+            self.obstacle_mask = obstacle_mask
+            self.neighbor_table = neighbor_table
+            self.open_neighbors = _open_neighbor_table(obstacle_mask, neighbor_table)
+            self.obstacle_hash = _obstacle_hash(obstacle_mask)
+            self.path_cache = {}
+            self.transient_cells = set()
+            self.start_pos = start_pos
+            self.goal_pos = goal_pos
             
             # Reset other variables
+            self.is_running = False
+            self.frame_task = None
+            self.search_thread = None
             self.robot_pos = None
             self.path = []
-            self.visited_cells = set()
-            self.frontier_cells = set()
+            self.visited_cells = []
+            self.frontier_cells = []
             self.current_cell = None
             
             # Update canvas size
             self.canvas.config(width=self.cols * self.cell_size, height=self.rows * self.cell_size)
             
+            self.create_cell_items()
             self.draw_grid()
             self.status_var.set(f"Layout loaded from {file_path}")
         except Exception as e:
@@ -353,20 +755,21 @@ class WarehouseRobotPicker:
         if 0 <= row < self.rows and 0 <= col < self.cols:
             if self.start_pos is None:
                 self.start_pos = (row, col)
-                self.grid[row][col] = CellType.START
+                self.set_cell(row, col, CellType.START)
                 self.status_var.set("Start position set. Click to set goal position")
             elif self.goal_pos is None:
                 self.goal_pos = (row, col)
-                self.grid[row][col] = CellType.GOAL
+                self.set_cell(row, col, CellType.GOAL)
                 self.status_var.set("Goal position set. Click 'Find Path' to start")
             else:
                 # Toggle obstacle
-                if self.grid[row][col] == CellType.EMPTY:
-                    self.grid[row][col] = CellType.OBSTACLE
-                elif self.grid[row][col] == CellType.OBSTACLE:
-                    self.grid[row][col] = CellType.EMPTY
+                idx = row * self.cols + col
+                if self.grid[idx] == CellType.EMPTY:
+                    self.set_cell(row, col, CellType.OBSTACLE)
+                elif self.grid[idx] == CellType.OBSTACLE:
+                    self.set_cell(row, col, CellType.EMPTY)
             
-            self.draw_grid()
+            self.schedule_redraw()
     
     def on_canvas_drag(self, event):
         if self.is_running:
@@ -376,40 +779,74 @@ class WarehouseRobotPicker:
         col = event.x // self.cell_size
         
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            if self.grid[row][col] == CellType.EMPTY:
-                self.grid[row][col] = CellType.OBSTACLE
-                self.draw_grid()
+            if self.grid[row * self.cols + col] == CellType.EMPTY:
+                self.set_cell(row, col, CellType.OBSTACLE)
+                self.schedule_redraw()
     
-    def draw_grid(self):
+    def schedule_redraw(self):
+        # Motion events can arrive far faster than frames; fold them into one draw per idle
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._flush_redraw)
+    
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self.draw_grid()
+    
+    def set_cell(self, row, col, cell_type):
+        # All grid writes go through here so draw_grid knows which rectangles to recolor
+        self.set_cells((row * self.cols + col,), cell_type)
+    
+    def set_cells(self, indices, cell_type):
+        # set_cell for a batch of indices; transient types never cover start or goal
+        grid = self.grid
+        mask = self.obstacle_mask
+        keys = _zobrist_keys(len(grid))
+        is_obstacle = cell_type == CellType.OBSTACLE
+        transient = cell_type in _TRANSIENT_CELLS
+        for idx in indices:
+            if grid[idx] != cell_type and not (transient and grid[idx] in _ENDPOINT_CELLS):
+                grid[idx] = cell_type
+                if mask[idx] != is_obstacle:
+                    mask[idx] = is_obstacle
+                    self.obstacle_hash ^= keys[idx]
+                    # Only the cells around this one gain or lose it as a neighbor
+                    for neighbor in self.neighbor_table[idx]:
+                        self.open_neighbors[neighbor] = _open_neighbors(mask, self.neighbor_table, neighbor)
+                self.dirty_cells.add(idx)
+                if transient:
+                    self.transient_cells.add(idx)
+    
+    def create_cell_items(self):
+        # One persistent rectangle per cell, rebuilt only when the grid itself is replaced
         self.canvas.delete("all")
+        self.robot_item = None
+        self.robot_drawn_pos = None
+        self.rect_ids = []
+        for idx, cell in enumerate(self.grid):
+            i, j = divmod(idx, self.cols)
+            x1 = j * self.cell_size
+            y1 = i * self.cell_size
+            x2 = x1 + self.cell_size
+            y2 = y1 + self.cell_size
+            
+            self.rect_ids.append(self.canvas.create_rectangle(x1, y1, x2, y2, fill=CELL_COLORS[cell], outline="gray"))
+        self.dirty_cells = set()
+    
+    def draw_grid(self):
+        # Recolor only the cells changed since the last draw
+        for idx in self.dirty_cells:
+            self.canvas.itemconfig(self.rect_ids[idx], fill=CELL_COLORS[self.grid[idx]])
+        self.dirty_cells.clear()
         
-        for i in range(self.rows):
-            for j in range(self.cols):
-                x1 = j * self.cell_size
-                y1 = i * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                
-                color = self.get_cell_color(self.grid[i][j])
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
-        
-        # Draw robot if present
+        # Draw robot if present, touching the canvas only when it has moved or gone
         if self.robot_pos:
-            self.draw_robot(self.robot_pos[0], self.robot_pos[1])
-    
-    def get_cell_color(self, cell_type):
-        colors = {
-            CellType.EMPTY: "white",
-            CellType.OBSTACLE: "black",
-            CellType.START: "green",
-            CellType.GOAL: "red",
-            CellType.PATH: "blue",
-            CellType.VISITED: "lightgray",
-            CellType.ROBOT: "orange",
-            CellType.FRONTIER: "lightblue",
-            CellType.CURRENT: "yellow"
-        }
-        return colors.get(cell_type, "white")
+            if self.robot_pos != self.robot_drawn_pos:
+                self.draw_robot(self.robot_pos[0], self.robot_pos[1])
+        elif self.robot_item is not None:
+            self.canvas.delete(self.robot_item)
+            self.robot_item = None
+            self.robot_drawn_pos = None
     
     def draw_robot(self, row, col):
         x1 = col * self.cell_size + 2
@@ -417,7 +854,12 @@ class WarehouseRobotPicker:
         x2 = x1 + self.cell_size - 4
         y2 = y1 + self.cell_size - 4
         
-        self.canvas.create_oval(x1, y1, x2, y2, fill="orange", outline="darkorange", width=2)
+        # A single oval is created once and then moved
+        if self.robot_item is None:
+            self.robot_item = self.canvas.create_oval(x1, y1, x2, y2, fill="orange", outline="darkorange", width=2)
+        else:
+            self.canvas.coords(self.robot_item, x1, y1, x2, y2)
+        self.robot_drawn_pos = (row, col)
     
     def find_path(self):
         if not self.start_pos or not self.goal_pos:
@@ -432,469 +874,219 @@ class WarehouseRobotPicker:
         self.status_var.set(f"Finding path using {self.algorithm_var.get()}...")
         
         # Run selected algorithm
-        algorithm = self.algorithm_var.get()
-        self.stats["algorithm"] = algorithm
-        
-        if algorithm == Algorithm.ASTAR.value:
-            self.root.after(100, self.run_astar)
-        elif algorithm == Algorithm.BFS.value:
-            self.root.after(100, self.run_bfs)
-        elif algorithm == Algorithm.DFS.value:
-            self.root.after(100, self.run_dfs)
-        elif algorithm == Algorithm.UCS.value:
-            self.root.after(100, self.run_ucs)
-        elif algorithm == Algorithm.DLS.value:
-            self.root.after(100, self.run_dls)
-    
-    def run_astar(self):
-        # Start timing
-        total_start_time = time.time()
-        
-        # Initialize open and closed sets
-        open_set = []
-        closed_set = set()
-        
-        # Add start node
-        heapq.heappush(open_set, (0, self.start_pos))
-        self.frontier_cells.add(self.start_pos)
-        
-        # Track paths
-        came_from = {}
-        
-        # Cost from start
-        g_score = {self.start_pos: 0}
-        
-        # Estimated total cost
-        f_score = {self.start_pos: self.heuristic(self.start_pos, self.goal_pos)}
-        
-        # Track visited cells for visualization
-        self.visited_cells = set()
-        self.stats["nodes_visited"] = 0
-        self.stats["nodes_explored"] = 0
-        
-        # Algorithm execution (without visualization delays)
-        algorithm_start_time = time.time()
-        found_path = None
-        
-        while open_set:
-            # Get node with lowest f_score
-            current = heapq.heappop(open_set)[1]
-            self.frontier_cells.discard(current)
-            
-            # Check if we reached the goal
-            if current == self.goal_pos:
-                found_path = self.reconstruct_path(came_from, current)
-                break
-            
-            # Mark current as visited
-            closed_set.add(current)
-            self.visited_cells.add(current)
-            self.stats["nodes_visited"] += 1
-            
-            # Check neighbors
-            for neighbor in self.get_neighbors(current):
-                if neighbor in closed_set:
-                    continue
-                
-                # Calculate tentative g_score
-                tentative_g_score = g_score[current] + 1
-                
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self.heuristic(neighbor, self.goal_pos)
-                    
-                    if neighbor not in [item[1] for item in open_set]:
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                        self.frontier_cells.add(neighbor)
-                        self.stats["nodes_explored"] += 1
-        
-        # Calculate algorithm execution time
-        algorithm_end_time = time.time()
-        self.stats["algorithm_time"] = algorithm_end_time - algorithm_start_time
-        
-        if found_path:
-            # Animate the search process if enabled
-            if self.show_search_var.get():
-                self.animate_search_process(came_from, found_path[-1])
-            else:
-                # Directly show the path
-                self.stats["path_length"] = len(found_path)
-                self.stats["total_time"] = time.time() - total_start_time
-                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-                self.animate_path(came_from, found_path[-1])
-        else:
-            # No path found
-            self.is_running = False
-            self.stats["total_time"] = time.time() - total_start_time
-            self.update_stats()
-            self.status_var.set("No path found!")
-            messagebox.showinfo("Path Not Found", "No path exists to the goal!")
+        self.stats["algorithm"] = self.algorithm_var.get()
+        self.root.after(100, self.run_search)
     
-    def run_bfs(self):
-        # Start timing
-        total_start_time = time.time()
-        
-        # Initialize queue and visited set
-        queue = deque([self.start_pos])
-        self.frontier_cells.add(self.start_pos)
-        visited = set([self.start_pos])
-        came_from = {}
-        
-        self.stats["nodes_visited"] = 0
-        self.stats["nodes_explored"] = 1
+    def run_search(self):
+        algorithm = self.stats["algorithm"]
         
-        # Algorithm execution (without visualization delays)
-        algorithm_start_time = time.time()
-        found_path = None
+        # Only DLS reads the depth limit
+        depth_limit = None
+        if algorithm == Algorithm.DLS.value:
+            try:
+                depth_limit = self.depth_limit_var.get()
+            except tk.TclError:
+                self.is_running = False
+                self.status_var.set("Invalid depth limit!")
+                messagebox.showwarning("Invalid Depth Limit", "Please enter a whole number for the depth limit")
+                return
         
-        while queue:
-            current = queue.popleft()
-            self.frontier_cells.discard(current)
-            self.stats["nodes_visited"] += 1
-            
-            # Check if we reached the goal
-            if current == self.goal_pos:
-                found_path = self.reconstruct_path(came_from, current)
-                break
-            
-            # Check neighbors
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    came_from[neighbor] = current
-                    queue.append(neighbor)
-                    self.frontier_cells.add(neighbor)
-                    self.stats["nodes_explored"] += 1
-        
-        # Calculate algorithm execution time
-        algorithm_end_time = time.time()
-        self.stats["algorithm_time"] = algorithm_end_time - algorithm_start_time
-        
-        if found_path:
-            # Animate the search process if enabled
-            if self.show_search_var.get():
-                self.animate_search_process(came_from, found_path[-1])
-            else:
-                # Directly show the path
-                self.stats["path_length"] = len(found_path)
-                self.stats["total_time"] = time.time() - total_start_time
-                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-                self.animate_path(came_from, found_path[-1])
-        else:
-            # No path found
-            self.is_running = False
-            self.stats["total_time"] = time.time() - total_start_time
-            self.update_stats()
-            self.status_var.set("No path found!")
-            messagebox.showinfo("Path Not Found", "No path exists to the goal!")
-    
-    def run_dfs(self):
         # Start timing
-        total_start_time = time.time()
+        self.total_start_ns = time.perf_counter_ns()
         
-        # Initialize stack and visited set
-        stack = [self.start_pos]
-        self.frontier_cells.add(self.start_pos)
-        visited = set()
-        came_from = {}
+        start = self.cell_index(self.start_pos)
+        goal = self.cell_index(self.goal_pos)
         
-        self.stats["nodes_visited"] = 0
-        self.stats["nodes_explored"] = 1
-        
-        # Algorithm execution (without visualization delays)
-        algorithm_start_time = time.time()
-        found_path = None
-        
-        while stack:
-            current = stack.pop()
-            self.frontier_cells.discard(current)
-            
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            self.stats["nodes_visited"] += 1
-            
-            # Check if we reached the goal
-            if current == self.goal_pos:
-                found_path = self.reconstruct_path(came_from, current)
-                break
-            
-            # Check neighbors (in reverse order for DFS)
-            neighbors = self.get_neighbors(current)
-            for neighbor in reversed(neighbors):
-                if neighbor not in visited:
-                    came_from[neighbor] = current
-                    stack.append(neighbor)
-                    self.frontier_cells.add(neighbor)
-                    self.stats["nodes_explored"] += 1
-        
-        # Calculate algorithm execution time
-        algorithm_end_time = time.time()
-        self.stats["algorithm_time"] = algorithm_end_time - algorithm_start_time
+        # Reuse a finished search for the same endpoints, algorithm and obstacles
+        cache_key = (start, goal, algorithm, depth_limit, self.obstacle_hash)
+        cached = self.path_cache.get(cache_key)
+        if cached is not None:
+            self.finish_search(*cached, depth_limit)
+            return
         
-        if found_path:
-            # Animate the search process if enabled
-            if self.show_search_var.get():
-                self.animate_search_process(came_from, found_path[-1])
-            else:
-                # Directly show the path
-                self.stats["path_length"] = len(found_path)
-                self.stats["total_time"] = time.time() - total_start_time
-                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-                self.animate_path(came_from, found_path[-1])
+        # Run the core on a worker thread over a copy of the walkable table
+        neighbors = list(self.open_neighbors)
+        outcome = []
+        worker = threading.Thread(target=self.search_worker,
+                                  args=(outcome, algorithm, neighbors, self.rows, self.cols, start, goal, depth_limit),
+                                  daemon=True)
+        self.search_thread = worker
+        worker.start()
+        self.root.after(SEARCH_POLL_MS, self.poll_search, worker, outcome, cache_key, depth_limit)
+    
+    def search_worker(self, outcome, algorithm, neighbors, rows, cols, start, goal, depth_limit):
+        # Runs off the Tk thread; outcome always gets the result or the error
+        algorithm_start_ns = time.perf_counter_ns()
+        try:
+            result = _run_core(algorithm, neighbors, rows, cols, start, goal, depth_limit)
+        except Exception as e:
+            outcome.append((None, 0, e))
         else:
-            # No path found
-            self.is_running = False
-            self.stats["total_time"] = time.time() - total_start_time
-            self.update_stats()
-            self.status_var.set("No path found!")
-            messagebox.showinfo("Path Not Found", "No path exists to the goal!")
+            outcome.append((result, time.perf_counter_ns() - algorithm_start_ns, None))
     
-    def run_ucs(self):
-        # Start timing
-        total_start_time = time.time()
-        
-        # Initialize priority queue and visited set
-        open_set = []
-        heapq.heappush(open_set, (0, self.start_pos))
-        self.frontier_cells.add(self.start_pos)
-        
-        # Track paths
-        came_from = {}
+    def poll_search(self, worker, outcome, cache_key, depth_limit):
+        if worker is not self.search_thread:
+            return  # the grid was reset or reloaded while this search ran
         
-        # Cost from start
-        g_score = {self.start_pos: 0}
-        
-        # Track visited cells for visualization
-        self.visited_cells = set()
-        self.stats["nodes_visited"] = 0
-        self.stats["nodes_explored"] = 1
+        if not outcome:
+            self.root.after(SEARCH_POLL_MS, self.poll_search, worker, outcome, cache_key, depth_limit)
+            return
         
-        # Algorithm execution (without visualization delays)
-        algorithm_start_time = time.time()
-        found_path = None
+        self.search_thread = None
+        result, algorithm_ns, error = outcome[0]
+        if error is not None:
+            self.is_running = False
+            self.status_var.set("Search failed!")
+            messagebox.showerror("Search Error", f"Error during search: {str(error)}")
+            return
         
-        while open_set:
-            # Get node with lowest g_score
-            current_cost, current = heapq.heappop(open_set)
-            self.frontier_cells.discard(current)
-            
-            if current in self.visited_cells:
-                continue
-                
-            self.visited_cells.add(current)
-            self.stats["nodes_visited"] += 1
-            
-            # Check if we reached the goal
-            if current == self.goal_pos:
-                found_path = self.reconstruct_path(came_from, current)
-                break
+        if len(self.path_cache) >= PATH_CACHE_SIZE:
+            del self.path_cache[next(iter(self.path_cache))]  # drop the oldest entry
+        self.path_cache[cache_key] = (result, algorithm_ns)
+        self.finish_search(result, algorithm_ns, depth_limit)
+    
+    def finish_search(self, result, algorithm_ns, depth_limit):
+        algorithm = self.stats["algorithm"]
+        self.stats["algorithm_time_ns"] = algorithm_ns
+        
+        goal, parents, visited, frontier, nodes_explored = result
+        # Kept as cell indices; only the animation turns them into (row, col)
+        self.visited_cells = visited
+        self.frontier_cells = frontier
+        self.stats["nodes_visited"] = len(visited)
+        self.stats["nodes_explored"] = nodes_explored
+        
+        if goal is not None:
+            # Walk the parent array once; playback and the robot both use this path
+            found_path = self.reconstruct_path(parents, goal)
             
-            # Check neighbors
-            for neighbor in self.get_neighbors(current):
-                if neighbor in self.visited_cells:
-                    continue
-                
-                # Calculate tentative g_score
-                tentative_g_score = g_score[current] + 1
-                
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    heapq.heappush(open_set, (tentative_g_score, neighbor))
-                    self.frontier_cells.add(neighbor)
-                    self.stats["nodes_explored"] += 1
-        
-        # Calculate algorithm execution time
-        algorithm_end_time = time.time()
-        self.stats["algorithm_time"] = algorithm_end_time - algorithm_start_time
-        
-        if found_path:
             # Animate the search process if enabled
             if self.show_search_var.get():
-                self.animate_search_process(came_from, found_path[-1])
+                self.animate_search_process(found_path)
             else:
                 # Directly show the path
                 self.stats["path_length"] = len(found_path)
-                self.stats["total_time"] = time.time() - total_start_time
-                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-                self.animate_path(came_from, found_path[-1])
+                self.stats["total_time_ns"] = time.perf_counter_ns() - self.total_start_ns
+                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time_ns'] / 1e9:.6f}s")
+                self.animate_path(found_path)
         else:
             # No path found
             self.is_running = False
-            self.stats["total_time"] = time.time() - total_start_time
+            self.stats["total_time_ns"] = time.perf_counter_ns() - self.total_start_ns
             self.update_stats()
-            self.status_var.set("No path found!")
-            messagebox.showinfo("Path Not Found", "No path exists to the goal!")
+            if algorithm == Algorithm.DLS.value:
+                self.status_var.set(f"No path found within depth limit {depth_limit}!")
+                messagebox.showinfo("Path Not Found", f"No path exists within depth limit {depth_limit}!")
+            else:
+                self.status_var.set("No path found!")
+                messagebox.showinfo("Path Not Found", "No path exists to the goal!")
     
-    def run_dls(self):
-        depth_limit = self.depth_limit_var.get()
-        # Start timing
-        total_start_time = time.time()
-        
-        # Initialize stack and visited set
-        stack = [(self.start_pos, 0)]  # (node, depth)
-        self.frontier_cells.add(self.start_pos)
-        visited = set()
-        came_from = {}
+    def animate_search_process(self, path):
+        # Replay the finished search's visit order
         
-        self.stats["nodes_visited"] = 0
-        self.stats["nodes_explored"] = 1
+        # Show frontier cells
+        self.set_cells(self.frontier_cells, CellType.FRONTIER)
         
-        # Algorithm execution (without visualization delays)
-        algorithm_start_time = time.time()
-        found_path = None
-        
-        while stack:
-            current, depth = stack.pop()
-            self.frontier_cells.discard(current)
-            
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            self.stats["nodes_visited"] += 1
-            
-            # Check if we reached the goal
-            if current == self.goal_pos:
-                found_path = self.reconstruct_path(came_from, current)
-                break
-            
-            # Check depth limit
-            if depth >= depth_limit:
-                continue
-            
-            # Check neighbors (in reverse order for DFS)
-            neighbors = self.get_neighbors(current)
-            for neighbor in reversed(neighbors):
-                if neighbor not in visited:
-                    came_from[neighbor] = current
-                    stack.append((neighbor, depth + 1))
-                    self.frontier_cells.add(neighbor)
-                    self.stats["nodes_explored"] += 1
-        
-        # Calculate algorithm execution time
-        algorithm_end_time = time.time()
-        self.stats["algorithm_time"] = algorithm_end_time - algorithm_start_time
-        
-        if found_path:
-            # Animate the search process if enabled
-            if self.show_search_var.get():
-                self.animate_search_process(came_from, found_path[-1])
-            else:
-                # Directly show the path
-                self.stats["path_length"] = len(found_path)
-                self.stats["total_time"] = time.time() - total_start_time
-                self.status_var.set(f"Path found! Length: {len(found_path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-                self.animate_path(came_from, found_path[-1])
-        else:
-            # No path found
-            self.is_running = False
-            self.stats["total_time"] = time.time() - total_start_time
-            self.update_stats()
-            self.status_var.set(f"No path found within depth limit {depth_limit}!")
-            messagebox.showinfo("Path Not Found", f"No path exists within depth limit {depth_limit}!")
-    
-    def animate_search_process(self, came_from, goal):
-        # Create a list of visited cells in order for animation
-        visited_order = list(self.visited_cells)
+        # Visit order for animation
+        self.animation_trace = self.visited_cells
         self.animate_visited_index = 0
         
         # Start animation
-        self.animate_search_step(came_from, goal, visited_order)
-    
-    def animate_search_step(self, came_from, goal, visited_order):
-        if self.animate_visited_index < len(visited_order):
-            # Show next visited cell
-            cell = visited_order[self.animate_visited_index]
-            if cell != self.start_pos and cell != self.goal_pos:
-                self.grid[cell[0]][cell[1]] = CellType.VISITED
-            
-            # Show frontier cells
-            for cell in self.frontier_cells:
-                if cell != self.start_pos and cell != self.goal_pos:
-                    self.grid[cell[0]][cell[1]] = CellType.FRONTIER
-            
-            self.draw_grid()
-            self.animate_visited_index += 1
-            
+        self.start_frame_task(lambda: self.animate_search_step(path))
+    
+    def animate_search_step(self, path):
+        # One visited cell is due every speed / 2 ms; paint them in one batch, then draw once
+        first = self.animate_visited_index
+        due = self.take_due_steps(self.speed_var.get() / 2)
+        self.animate_visited_index = min(first + due, len(self.animation_trace))
+        self.set_cells(self.animation_trace[first:self.animate_visited_index], CellType.VISITED)
+        self.draw_grid()
+        
+        if self.animate_visited_index < len(self.animation_trace):
             # Continue animation
-            self.root.after(max(10, self.speed_var.get() // 2), 
-                          lambda: self.animate_search_step(came_from, goal, visited_order))
-        else:
-            # Animation complete, show the path
-            path = self.reconstruct_path(came_from, goal)
-            self.stats["path_length"] = len(path)
-            self.stats["total_time"] = time.time() - time.time()  # Will be updated in animate_path
-            self.status_var.set(f"Path found! Length: {len(path)} cells, Algorithm time: {self.stats['algorithm_time']:.6f}s")
-            self.animate_path(came_from, goal)
+            return True
+        
+        # Animation complete, show the path
+        self.stats["path_length"] = len(path)
+        self.stats["total_time_ns"] = time.perf_counter_ns() - self.total_start_ns
+        self.status_var.set(f"Path found! Length: {len(path)} cells, Algorithm time: {self.stats['algorithm_time_ns'] / 1e9:.6f}s")
+        self.animate_path(path)
+        return False
+    
+    def start_frame_task(self, task):
+        # Run task on every frame until it returns False; the first step is due at once
+        self.frame_task = task
+        self.animation_credit = 1.0
+        self.animation_last_tick = time.perf_counter_ns()
+        self.schedule_frame()
+    
+    def schedule_frame(self):
+        # At most one frame_tick is ever pending, whoever asks for the next frame
+        if not self.display_scheduled:
+            self.display_scheduled = True
+            self.root.after(1000 // self.get_target_fps(), self.frame_tick)
+    
+    def get_target_fps(self):
+        # Keep the last valid rate while the spinbox holds invalid text
+        try:
+            fps = self.target_fps_var.get()
+        except tk.TclError:
+            return self.target_fps
+        self.target_fps = min(max(fps, MIN_TARGET_FPS), MAX_TARGET_FPS)
+        return self.target_fps
+    
+    def frame_tick(self):
+        self.display_scheduled = False
+        task = self.frame_task
+        if task is not None and task() and self.frame_task is task:
+            self.schedule_frame()
+    
+    def take_due_steps(self, ms_per_step):
+        # Whole steps due by wall-clock time since the last frame; the remainder carries over
+        now = time.perf_counter_ns()
+        self.animation_credit += (now - self.animation_last_tick) / 1e6 / max(1, ms_per_step)
+        self.animation_last_tick = now
+        due = int(self.animation_credit)
+        self.animation_credit -= due
+        return due
     
     def update_search_visualization(self):
         # Clear previous visualization
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.grid[i][j] in [CellType.VISITED, CellType.FRONTIER, CellType.CURRENT]:
-                    if (i, j) == self.start_pos:
-                        self.grid[i][j] = CellType.START
-                    elif (i, j) == self.goal_pos:
-                        self.grid[i][j] = CellType.GOAL
-                    else:
-                        self.grid[i][j] = CellType.EMPTY
+        grid = self.grid
+        search_cells = (CellType.VISITED, CellType.FRONTIER, CellType.CURRENT)
+        self.set_cells([idx for idx in self.transient_cells if grid[idx] in search_cells], CellType.EMPTY)
         
         # Mark visited cells
-        for cell in self.visited_cells:
-            if cell != self.start_pos and cell != self.goal_pos:
-                self.grid[cell[0]][cell[1]] = CellType.VISITED
+        self.set_cells(self.visited_cells, CellType.VISITED)
         
         # Mark frontier cells
-        for cell in self.frontier_cells:
-            if cell != self.start_pos and cell != self.goal_pos:
-                self.grid[cell[0]][cell[1]] = CellType.FRONTIER
+        self.set_cells(self.frontier_cells, CellType.FRONTIER)
         
         # Mark current cell
         if self.current_cell and self.current_cell != self.start_pos and self.current_cell != self.goal_pos:
-            self.grid[self.current_cell[0]][self.current_cell[1]] = CellType.CURRENT
+            self.set_cell(self.current_cell[0], self.current_cell[1], CellType.CURRENT)
         
         self.draw_grid()
     
-    def get_neighbors(self, pos):
-        neighbors = []
-        row, col = pos
-        
-        # Four directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            
-            if (0 <= new_row < self.rows and 0 <= new_col < self.cols and 
-                self.grid[new_row][new_col] != CellType.OBSTACLE):
-                neighbors.append((new_row, new_col))
-        
-        return neighbors
+    def cell_index(self, pos):
+        return pos[0] * self.cols + pos[1]
     
-    def heuristic(self, pos1, pos2):
-        # Manhattan distance
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-    
-    def reconstruct_path(self, came_from, current):
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
+    def reconstruct_path(self, parents, current):
+        # Follow the parent array back to the start, handing (row, col) cells to the GUI
+        path = []
+        while current != -1:
+            path.append(divmod(current, self.cols))
+            current = parents[current]
         path.reverse()
         return path
     
-    def animate_path(self, came_from, current):
-        path = self.reconstruct_path(came_from, current)
+    def animate_path(self, path):
         self.path = path
         
         # Mark path cells
         for i, (row, col) in enumerate(path):
             if i > 0 and i < len(path) - 1:  # Skip start and goal
-                self.grid[row][col] = CellType.PATH
+                self.set_cell(row, col, CellType.PATH)
         
         self.draw_grid()
         self.update_stats()
@@ -903,43 +1095,61 @@ class WarehouseRobotPicker:
         self.robot_pos = self.start_pos
         self.draw_robot(self.robot_pos[0], self.robot_pos[1])
         
-        self.move_robot_along_path(path)
+        # The robot walks its own deque, so self.path keeps the whole route
+        route = deque(path)
+        self.start_frame_task(lambda: self.move_robot_along_path(route))
     
     def move_robot_along_path(self, path):
+        # One move is due every speed ms, at least 50
+        for _ in range(self.take_due_steps(max(50, self.speed_var.get()))):
+            if not path:
+                break
+            
+            # Move to next position
+            next_pos = path.popleft()
+            self.robot_pos = next_pos
+            self.draw_robot(self.robot_pos[0], self.robot_pos[1])
+        
         if not path:
             self.is_running = False
-            return
-        
-        # Move to next position
-        next_pos = path.pop(0)
-        self.robot_pos = next_pos
-        self.draw_robot(self.robot_pos[0], self.robot_pos[1])
+            return False
         
         # Continue moving
-        self.root.after(max(50, self.speed_var.get()), lambda: self.move_robot_along_path(path))
+        return True
 
     
     def update_stats(self):
-        stats_text = f"Algorithm: {self.stats['algorithm']}\n"
-        stats_text += f"Path Length: {self.stats['path_length']}\n"
-        stats_text += f"Nodes Visited: {self.stats['nodes_visited']}\n"
-        stats_text += f"Nodes Explored: {self.stats['nodes_explored']}\n"
-        stats_text += f"Algorithm Time: {self.stats['algorithm_time']:.6f}s\n"
-        stats_text += f"Total Time: {self.stats['total_time']:.3f}s\n"
+        texts = {
+            "algorithm": f"Algorithm: {self.stats['algorithm']}",
+            "path_length": f"Path Length: {self.stats['path_length']}",
+            "nodes_visited": f"Nodes Visited: {self.stats['nodes_visited']}",
+            "nodes_explored": f"Nodes Explored: {self.stats['nodes_explored']}",
+            "algorithm_time": f"Algorithm Time: {self.stats['algorithm_time_ns'] / 1e9:.6f}s",
+            "total_time": f"Total Time: {self.stats['total_time_ns'] / 1e9:.3f}s",
+            "depth_limit": "",
+            "optimal": ""
+        }
         
         # Add algorithm-specific info
         if self.stats['algorithm'] == Algorithm.DLS.value:
-            stats_text += f"Depth Limit: {self.depth_limit_var.get()}\n"
+            try:
+                texts["depth_limit"] = f"Depth Limit: {self.depth_limit_var.get()}"
+            except tk.TclError:
+                texts["depth_limit"] = "Depth Limit: -"  # the spinbox is mid-edit
         
         # Add optimality info
         if self.stats['path_length'] > 0:
-            if self.stats['algorithm'] in [Algorithm.ASTAR.value, Algorithm.BFS.value, Algorithm.UCS.value]:
-                stats_text += "Optimal: Yes\n"
+            if self.stats['algorithm'] in [Algorithm.ASTAR.value, Algorithm.BFS.value, Algorithm.UCS.value, Algorithm.IDDFS.value,
+                                           Algorithm.BIDIRECTIONAL_BFS.value]:
+                texts["optimal"] = "Optimal: Yes"
             else:
-                stats_text += "Optimal: No\n"
+                texts["optimal"] = "Optimal: No"
         
-        self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(tk.END, stats_text)
+        # Touch only the labels whose line changed
+        for key, text in texts.items():
+            if self.stat_texts.get(key) != text:
+                self.stat_texts[key] = text
+                self.stat_vars[key].set(text)
 
 def main():
     root = tk.Tk()